@@ -0,0 +1,161 @@
+"""
+CUDA version of EaseGrid.geodetic2ease for large device-resident inputs.
+
+The kernels reuse the per-point transforms from _kernels as CUDA device
+functions and run one thread per point. cupy and numba.cuda are optional;
+HAS_CUDA is False if either of them is missing.
+"""
+
+import functools
+import math
+
+from . import _kernels
+from .ease_grid import _EDGE_TOL, _LAT_RANGE_MSG, _OUTSIDE_GRID_MSG
+
+# The kernels only need numba.cuda, so that they can also be run on host
+# arrays with the CUDA simulator (NUMBA_ENABLE_CUDASIM=1)
+try:
+    from numba import cuda
+
+    HAS_NUMBA_CUDA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA_CUDA = False
+
+try:
+    import cupy  # type: ignore
+
+    HAS_CUPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_CUPY = False
+
+HAS_CUDA = HAS_NUMBA_CUDA and HAS_CUPY
+
+THREADS_PER_BLOCK = 256
+
+_FORWARD_POINT = {
+    6931: _kernels.laea_forward_point,
+    6932: _kernels.laea_forward_point,
+    6933: _kernels.cea_forward_point,
+}
+
+
+def _cell_index_point(value, edges, inv_res):
+    """
+    Find the cell of a regular axis containing value, like _cell_index in
+    ease_grid: the multiply and floor, except close to a cell edge, where the
+    cell is looked up in the (ascending) edges.
+    """
+    pos = (value - edges[0]) * inv_res
+    index = math.floor(pos)
+    if abs(pos - index - 0.5) > 0.5 - _EDGE_TOL:
+        # number of inner edges (edges[1:-1]) <= value, by bisection
+        lo = 1
+        hi = edges.shape[0] - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if edges[mid] <= value:
+                lo = mid + 1
+            else:
+                hi = mid
+        index = lo - 1
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _forward_kernel(epsg: int):
+    """
+    Compile (once per projection) the kernel converting lat/lon to EASE
+    coordinates and grid indices. Indices of points outside the grid, or that
+    cannot be projected, are set to -1.
+    """
+    forward_point = cuda.jit(device=True)(_FORWARD_POINT[epsg])
+    cell_index = cuda.jit(device=True)(_cell_index_point)
+
+    @cuda.jit
+    def _ease_fwd_cuda(
+        lat,
+        lon,
+        out_x,
+        out_y,
+        out_col,
+        out_row,
+        x_edges,
+        y_edges,
+        inv_res_x,
+        inv_res_y,
+        south,
+    ):
+        i = cuda.grid(1)
+        if i >= lat.shape[0]:
+            return
+        x, y = forward_point(lat[i], lon[i], south)
+        out_x[i] = x
+        out_y[i] = y
+        # the edges run along x and along -y, see EaseGrid._x_edges/_y_edges
+        if x_edges[0] <= x <= x_edges[-1] and y_edges[0] <= -y <= y_edges[-1]:
+            out_col[i] = cell_index(x, x_edges, inv_res_x)
+            out_row[i] = cell_index(-y, y_edges, inv_res_y)
+        else:
+            out_col[i] = -1
+            out_row[i] = -1
+
+    return _ease_fwd_cuda
+
+
+def _launch(grid, lat, lon, x_edges, y_edges, xx, yy, xcol_id, yrow_id):
+    """
+    Run the forward kernel of grid on flat device arrays, writing into xx, yy,
+    xcol_id and yrow_id.
+    """
+    blocks = (lat.size + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    if blocks:
+        _forward_kernel(grid.epsg)[blocks, THREADS_PER_BLOCK](
+            lat,
+            lon,
+            xx,
+            yy,
+            xcol_id,
+            yrow_id,
+            x_edges,
+            y_edges,
+            grid.params.inv_res_x,
+            grid.params.inv_res_y,
+            grid.epsg == 6932,
+        )
+
+
+def geodetic2ease(grid, lat, lon):
+    """
+    Run the forward conversion of grid (an EaseGrid) on the GPU. See
+    EaseGrid.geodetic2ease_gpu.
+    """
+    if not HAS_CUDA:
+        msg = "geodetic2ease_gpu requires cupy and numba with CUDA support."
+        raise ImportError(msg)
+
+    lat = cupy.ascontiguousarray(lat, dtype=cupy.float64)
+    lon = cupy.ascontiguousarray(lon, dtype=cupy.float64)
+    if lat.shape != lon.shape:
+        msg = "lat and lon must have the same shape."
+        raise ValueError(msg)
+    if bool(cupy.any(cupy.abs(lat) > 90.0)):
+        raise ValueError(_LAT_RANGE_MSG)
+
+    shape = lat.shape
+    lat = lat.ravel()
+    lon = lon.ravel()
+    xx = cupy.empty_like(lat)
+    yy = cupy.empty_like(lat)
+    xcol_id = cupy.empty(lat.shape, dtype=grid._idx_dtype)
+    yrow_id = cupy.empty(lat.shape, dtype=grid._idx_dtype)
+    x_edges = cupy.asarray(grid._x_edges)
+    y_edges = cupy.asarray(grid._y_edges)
+    _launch(grid, lat, lon, x_edges, y_edges, xx, yy, xcol_id, yrow_id)
+
+    if bool(cupy.any(xcol_id < 0)):
+        raise ValueError(_OUTSIDE_GRID_MSG)
+
+    return (
+        (xcol_id.reshape(shape), yrow_id.reshape(shape)),
+        (xx.reshape(shape), yy.reshape(shape)),
+    )
@@ -0,0 +1,295 @@
+"""
+Closed-form forward/inverse transforms for the three EASE2.0 projections.
+
+EPSG:6931/6932 are the polar aspects of the Lambert Azimuthal Equal-Area
+projection and EPSG:6933 is the Cylindrical Equal-Area projection with a
+standard parallel of 30 degrees, all on the WGS84 ellipsoid. The formulas
+follow Snyder (1987), "Map Projections - A Working Manual", and mirror the
+corresponding PROJ routines, including how they report invalid input (inf
+for forward errors, nan latitudes for coordinates outside the projection).
+
+The kernels are compiled with numba when it is installed. numba is only
+imported when the kernels are first used, since importing it takes a good
+fraction of a second. Without numba they still run as plain Python loops,
+which is only useful for testing, so EaseGrid only routes through them when
+numba is available (see supports).
+"""
+
+import functools
+import importlib.util
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Whether numba is installed; set to False if importing it fails (e.g. for an
+# unsupported numpy version), see _loops
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+# Replaced by numba.prange when the kernels are compiled
+prange = range
+
+
+# WGS84 ellipsoid
+_A = 6378137.0
+_F = 1.0 / 298.257223563
+_E2 = _F * (2.0 - _F)
+_E = math.sqrt(_E2)
+# Forward transforms are rejected beyond 10 radians of longitude, like PROJ
+_MAX_LAM = 10.0
+_EPS10 = 1.0e-10
+
+
+_ONE_ES = 1.0 - _E2
+# Authalic q at the pole
+_QP = _ONE_ES * (1.0 / _ONE_ES + math.atanh(_E) / _E)
+# Series coefficients converting authalic to geodetic latitude
+_APA0 = _E2 / 3.0 + 31.0 * _E2 ** 2 / 180.0 + 517.0 * _E2 ** 3 / 5040.0
+_APA1 = 23.0 * _E2 ** 2 / 360.0 + 251.0 * _E2 ** 3 / 3780.0
+_APA2 = 761.0 * _E2 ** 3 / 45360.0
+# Cylindrical Equal-Area scale factor at the standard parallel (30 degrees)
+_SIN_TS = math.sin(math.radians(30.0))
+_K0 = math.cos(math.radians(30.0)) / math.sqrt(1.0 - _E2 * _SIN_TS * _SIN_TS)
+
+
+# Per-point transforms. These only use the math module and module constants,
+# so the same functions are compiled both for the CPU loops below and as CUDA
+# device functions (see _cuda). All take a south flag to share one signature.
+
+
+def laea_forward_point(lat, lon, south):
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    # the opposite pole cannot be projected
+    antipode = phi - 0.5 * math.pi if south else phi + 0.5 * math.pi
+    if abs(lam) > _MAX_LAM or abs(antipode) < _EPS10:
+        return math.inf, math.inf
+    # qp -/+ q(sin(phi)) rewritten in terms of t = 1 -/+ sin(phi), which avoids
+    # the cancellation between qp and q close to the projection pole
+    if south:
+        phi = -phi
+    sinphi = math.sin(phi)
+    t = 2.0 * math.sin(0.25 * math.pi - 0.5 * phi) ** 2
+    b = t * (1.0 + _E2 * sinphi) / (1.0 - _E2 * sinphi * sinphi) + _ONE_ES * (
+        math.atanh(_E * t / (1.0 - _E2 * sinphi)) / _E
+    )
+    b = _A * math.sqrt(b)
+    if south:
+        return b * math.sin(lam), b * math.cos(lam)
+    return b * math.sin(lam), -b * math.cos(lam)
+
+
+def laea_inverse_point(x, y, south):
+    xn = x / _A
+    yn = y / _A if south else -y / _A
+    rho2 = xn * xn + yn * yn
+    if rho2 == 0.0:
+        return (-90.0 if south else 90.0), 0.0
+    ab = rho2 / _QP - 1.0 if south else 1.0 - rho2 / _QP
+    lon = math.degrees(math.atan2(xn, yn))
+    if abs(ab) > 1.0:
+        return math.nan, lon
+    beta = math.asin(ab)
+    phi = (
+        beta
+        + _APA0 * math.sin(2.0 * beta)
+        + _APA1 * math.sin(4.0 * beta)
+        + _APA2 * math.sin(6.0 * beta)
+    )
+    return math.degrees(phi), lon
+
+
+def cea_forward_point(lat, lon, south):
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    if abs(lam) > _MAX_LAM:
+        return math.inf, math.inf
+    if abs(lam) > math.pi:
+        lam -= 2.0 * math.pi * math.floor((lam + math.pi) / (2.0 * math.pi))
+    sinphi = math.sin(phi)
+    q = _ONE_ES * (
+        sinphi / (1.0 - _E2 * sinphi * sinphi) + math.atanh(_E * sinphi) / _E
+    )
+    return _A * _K0 * lam, 0.5 * _A * q / _K0
+
+
+def cea_inverse_point(x, y, south):
+    lam = x / (_A * _K0)
+    if abs(lam) > math.pi:
+        lam -= 2.0 * math.pi * math.floor((lam + math.pi) / (2.0 * math.pi))
+    lon = math.degrees(lam)
+    t = 2.0 * y * _K0 / (_A * _QP)
+    if abs(t) > 1.0:
+        return math.nan, lon
+    beta = math.asin(t)
+    phi = (
+        beta
+        + _APA0 * math.sin(2.0 * beta)
+        + _APA1 * math.sin(4.0 * beta)
+        + _APA2 * math.sin(6.0 * beta)
+    )
+    return math.degrees(phi), lon
+
+
+# Replaced by their numba compiled versions when the kernels are compiled
+_laea_forward_point = laea_forward_point
+_laea_inverse_point = laea_inverse_point
+_cea_forward_point = cea_forward_point
+_cea_inverse_point = cea_inverse_point
+
+
+def laea_forward(lat, lon, out_x, out_y, south):
+    for i in prange(lat.shape[0]):
+        out_x[i], out_y[i] = _laea_forward_point(lat[i], lon[i], south)
+
+
+def laea_inverse(x, y, out_lat, out_lon, south):
+    for i in prange(x.shape[0]):
+        out_lat[i], out_lon[i] = _laea_inverse_point(x[i], y[i], south)
+
+
+def cea_forward(lat, lon, out_x, out_y):
+    for i in prange(lat.shape[0]):
+        out_x[i], out_y[i] = _cea_forward_point(lat[i], lon[i], False)
+
+
+def cea_inverse(x, y, out_lat, out_lon):
+    for i in prange(x.shape[0]):
+        out_lat[i], out_lon[i] = _cea_inverse_point(x[i], y[i], False)
+
+
+@functools.lru_cache(maxsize=None)
+def _loops():
+    """
+    Return the laea_forward, laea_inverse, cea_forward and cea_inverse loops,
+    compiled with numba (on the first call) if it is installed and imports.
+    """
+    global HAS_NUMBA
+    if not HAS_NUMBA:
+        return laea_forward, laea_inverse, cea_forward, cea_inverse
+
+    try:
+        import numba
+    except ImportError as err:
+        logger.warning(f"numba could not be imported, falling back to pyproj: {err}")
+        HAS_NUMBA = False
+        return laea_forward, laea_inverse, cea_forward, cea_inverse
+
+    global prange, _laea_forward_point, _laea_inverse_point
+    global _cea_forward_point, _cea_inverse_point
+    prange = numba.prange
+    point_jit = numba.njit(cache=True, inline="always")
+    _laea_forward_point = point_jit(laea_forward_point)
+    _laea_inverse_point = point_jit(laea_inverse_point)
+    _cea_forward_point = point_jit(cea_forward_point)
+    _cea_inverse_point = point_jit(cea_inverse_point)
+    # fastmath without the nnan/ninf flags, since the kernels report invalid
+    # points through nan/inf values
+    loop_jit = numba.njit(
+        parallel=True, cache=True, fastmath={"nsz", "arcp", "contract"}
+    )
+    return (
+        loop_jit(laea_forward),
+        loop_jit(laea_inverse),
+        loop_jit(cea_forward),
+        loop_jit(cea_inverse),
+    )
+
+
+def forward(epsg: int, lon: np.ndarray, lat: np.ndarray, inplace: bool = False):
+    """
+    Project geodetic coordinates to EASE x/y coordinates. Takes and returns
+    values in the same (lon, lat) -> (x, y) order as pyproj.Transformer.
+
+    Parameters
+    ----------
+    epsg : int
+        EPSG code of the EASE projection (6931, 6932 or 6933)
+    lon : np.ndarray
+        longitude(s) in degrees
+    lat : np.ndarray
+        latitude(s) in degrees
+    inplace : bool
+        write x and y into lon and lat (which must then be C-contiguous
+        float64 arrays of the same shape) instead of new arrays
+    Returns
+    -------
+    xx, yy : tuple[np.ndarray, np.ndarray]
+        EASE coordinates, broadcast to the common shape of the inputs
+    """
+    if not inplace:
+        lon, lat = np.broadcast_arrays(lon, lat)
+    shape = lon.shape
+    lon_flat = np.ascontiguousarray(lon, dtype=np.float64).ravel()
+    lat_flat = np.ascontiguousarray(lat, dtype=np.float64).ravel()
+    if inplace:
+        xx, yy = lon_flat, lat_flat
+    else:
+        xx = np.empty_like(lon_flat)
+        yy = np.empty_like(lon_flat)
+    # Each point is read before its outputs are written, so the in-place
+    # aliasing of the inputs and outputs is safe
+    laea_forward_loop, _, cea_forward_loop, _ = _loops()
+    if epsg == 6933:
+        cea_forward_loop(lat_flat, lon_flat, xx, yy)
+    else:
+        laea_forward_loop(lat_flat, lon_flat, xx, yy, epsg == 6932)
+    return xx.reshape(shape), yy.reshape(shape)
+
+
+def inverse(epsg: int, xx: np.ndarray, yy: np.ndarray, inplace: bool = False):
+    """
+    Convert EASE x/y coordinates back to geodetic coordinates. Takes and
+    returns values in the same (x, y) -> (lon, lat) order as
+    pyproj.Transformer.
+
+    Parameters
+    ----------
+    epsg : int
+        EPSG code of the EASE projection (6931, 6932 or 6933)
+    xx : np.ndarray
+        x coordinate(s) in the EASE coordinate system
+    yy : np.ndarray
+        y coordinate(s) in the EASE coordinate system
+    inplace : bool
+        write lon and lat into xx and yy (which must then be C-contiguous
+        float64 arrays of the same shape) instead of new arrays
+    Returns
+    -------
+    lon, lat : tuple[np.ndarray, np.ndarray]
+        geodetic coordinates, broadcast to the common shape of the inputs
+    """
+    if not inplace:
+        xx, yy = np.broadcast_arrays(xx, yy)
+    shape = xx.shape
+    xx_flat = np.ascontiguousarray(xx, dtype=np.float64).ravel()
+    yy_flat = np.ascontiguousarray(yy, dtype=np.float64).ravel()
+    if inplace:
+        lon, lat = xx_flat, yy_flat
+    else:
+        lon = np.empty_like(xx_flat)
+        lat = np.empty_like(xx_flat)
+    # Each point is read before its outputs are written, so the in-place
+    # aliasing of the inputs and outputs is safe
+    _, laea_inverse_loop, _, cea_inverse_loop = _loops()
+    if epsg == 6933:
+        cea_inverse_loop(xx_flat, yy_flat, lat, lon)
+    else:
+        laea_inverse_loop(xx_flat, yy_flat, lat, lon, epsg == 6932)
+    return lon.reshape(shape), lat.reshape(shape)
+
+
+def supports(*arrays) -> bool:
+    """
+    Whether the compiled kernels can be used for the given inputs: numba is
+    installed and imports, and all inputs are non-scalar numeric arrays.
+    """
+    if not HAS_NUMBA or not all(
+        isinstance(a, np.ndarray) and a.ndim > 0 and a.dtype.kind in "fiu"
+        for a in arrays
+    ):
+        return False
+    # importing numba (on the first call) clears HAS_NUMBA if it fails
+    _loops()
+    return HAS_NUMBA
@@ -1,11 +1,212 @@
+import functools
 import logging
+import math
+import threading
+import types
 import typing
 
 import numpy as np
+import numpy.typing as npt
 import pyproj
 
+from . import _kernels
+
 logger = logging.getLogger(__name__)
 
+# Error messages shared by all conversions (and the GPU version in _cuda)
+_LAT_RANGE_MSG = "There are input lat values with absolute values above 90 degrees."
+_OUTSIDE_GRID_MSG = (
+    "Some geodetic coordinates are outside of EASE grid validity range. "
+    "Check documentation at https://nsidc.org/ease/ease-grid-projection-gt."
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_transformer(epsg_from: int, epsg_to: int) -> pyproj.Transformer:
+    """
+    Build (once) the transformer between two EPSG coordinate systems. The
+    transformers are shared between all grids using the same projection.
+
+    Parameters
+    ----------
+    epsg_from : int
+        EPSG code of the source coordinate system
+    epsg_to : int
+        EPSG code of the target coordinate system
+    Returns
+    -------
+    transformer : pyproj.Transformer
+        Transformer using the lon, lat (x, y) argument order
+    """
+    crs_from, crs_to = f"EPSG:{epsg_from}", f"EPSG:{epsg_to}"
+    try:
+        # Only consider the best operation instead of letting PROJ fall back
+        # between candidate operations at transform time (pyproj >= 3.4; it
+        # replaces skip_equivalent, which is a no-op in pyproj 3)
+        return pyproj.Transformer.from_crs(
+            crs_from, crs_to, always_xy=True, only_best=True
+        )
+    except TypeError:
+        return pyproj.Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
+class _GridParams(typing.NamedTuple):
+    """
+    Constants of a grid needed by the coordinate conversions, computed once
+    in __init__ and gathered in an immutable NamedTuple: the grid bounds and
+    (reciprocal) resolutions as floats, the grid size and the projection name.
+    """
+
+    xmin: float
+    xmax: float
+    ymax: float
+    res_x: float
+    res_y: float
+    inv_res_x: float
+    inv_res_y: float
+    cols: int
+    rows: int
+    projection: str
+
+
+class _ProjectionSpec(typing.NamedTuple):
+    """
+    Definition of one of the EASE2.0 projections. The grid size is given for
+    the (hypothetical) 3 m grid and scales inversely with the resolution.
+    """
+
+    epsg: int
+    # Corner of the grid in EASE coordinates, the grid is symmetric around 0
+    xmin: float
+    # None for the Global grid, whose y range follows from its square cells
+    ymax: typing.Optional[float]
+    base_cols: int
+    base_rows: int
+    description: str
+
+
+_PROJ_TABLE: typing.Mapping[str, _ProjectionSpec] = types.MappingProxyType(
+    {
+        "NorthHemi": _ProjectionSpec(
+            6931,
+            -9000000.0,
+            9000000.0,
+            6000000,
+            6000000,
+            "EASE Northern Hemisphere, Lambert Azimuthal projection",
+        ),
+        "SouthHemi": _ProjectionSpec(
+            6932,
+            -9000000.0,
+            9000000.0,
+            6000000,
+            6000000,
+            "EASE Southern Hemisphere, Lambert Azimuthal projection",
+        ),
+        "Global": _ProjectionSpec(
+            6933,
+            -17367530.45,
+            None,
+            11568000,
+            4872000,
+            "EASE Global, Equal-Area projection",
+        ),
+    }
+)
+
+
+_scratch = threading.local()
+# Largest work array (in elements, 8 MB) kept between calls
+_SCRATCH_MAX = 1 << 20
+
+
+def _scratch_buffer(shape: typing.Tuple[int, ...]) -> np.ndarray:
+    """
+    Return a float64 work array of the given shape. Arrays of up to
+    _SCRATCH_MAX elements reuse memory between calls in the same thread, so
+    the result is only valid until the next call; larger ones are allocated
+    for each call, so they are not kept for the life of the thread.
+    """
+    size = int(np.prod(shape))
+    if size > _SCRATCH_MAX:
+        return np.empty(shape)
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size)
+        _scratch.buffer = buffer
+    return buffer[:size].reshape(shape)
+
+
+# Values this close to a cell edge (in cells) are looked up in the edges,
+# since the multiply and floor used for all others could be off by one there
+_EDGE_TOL = 1e-6
+# Batches up to this size are looked up in the edges directly, which is
+# faster than the multiply and floor for so few values
+_SEARCH_MAX = 64
+# Elements of each float64 work buffer used when building the whole grid
+# (2 MB), so that the tiles stay small on grids with many columns
+_TILE_ELEMENTS = 1 << 18
+
+
+def _cell_index(
+    values: np.ndarray, edges: np.ndarray, inv_res: float, sign: int, out: np.ndarray
+) -> np.ndarray:
+    """
+    Find the cells of a regular axis containing values, and write their
+    indices into out (an integer array of the same shape). Values on the edge
+    between two cells belong to the upper one, except for the last edge, which
+    closes the last cell.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        coordinate values, which must lie between the first and last edge
+    edges : np.ndarray
+        ascending cell edges in terms of sign * values
+    inv_res : float
+        reciprocal of the cell size
+    sign : int
+        1, or -1 for axes whose indices increase with decreasing values
+    out : np.ndarray
+        integer array receiving the indices
+    Returns
+    -------
+    out : np.ndarray
+        the cell indices
+    """
+    inner = edges[1:-1]
+    if values.size <= _SEARCH_MAX:
+        out[...] = np.searchsorted(inner, sign * values, side="right")
+        return out
+
+    work = _scratch_buffer(values.shape)
+    np.subtract(values, sign * edges[0], out=work)
+    np.multiply(work, sign * inv_res, out=work)
+    np.floor(work, out=out, casting="unsafe")
+    # distance (in cells) to the nearest edge, minus one half
+    np.subtract(work, out, out=work)
+    np.subtract(work, 0.5, out=work)
+    np.abs(work, out=work)
+    near = work > 0.5 - _EDGE_TOL
+    if near.any():
+        out[near] = np.searchsorted(inner, sign * values[near], side="right")
+    return out
+
+
+def _cell_index_scalar(
+    value: float, origin: float, inv_res: float, sign: int, edges: np.ndarray
+) -> int:
+    """
+    Find the cell containing a single value, see _cell_index. origin is the
+    value at the first edge, passed as a float to keep this free of numpy
+    scalar arithmetic.
+    """
+    pos = (value - origin) * (sign * inv_res)
+    index = math.floor(pos)
+    if abs(pos - index - 0.5) > 0.5 - _EDGE_TOL:
+        index = int(np.searchsorted(edges[1:-1], sign * value, side="right"))
+    return index
+
 
 class EaseGrid(object):
     """
@@ -27,17 +228,15 @@ class EaseGrid(object):
     * Convert geodetic coordinate to requested EASE2.0 coordinate system
     * Determine grid indices in the x and y coordinates using a regular grid
 
-    The geodetic centroids of the grid cells are stored in the geodetic_grid
-    member after this class is initialised. Due to this procedure, there is some
-    ambiguity in what we mean by conversion functions such as geodetic2ease and
-    ease2geodetic: is the user requesting a conversion to the EASE coordinate
-    system (or back), or are they working with grid indices? The geodetic2ease
-    conversion returns both the grid indices and the coordinates in the EASE
-    coordinate system. This is done because the common use-case is to grid
-    values into EASE grids, but the EASE coordinates have to be calculated as
-    part of this, and it is therefore unnecessary to maintain separate
-    functions. When converting back to geodetic, two functions are instead
-    provided:
+    Due to this procedure, there is some ambiguity in what we mean by conversion
+    functions such as geodetic2ease and ease2geodetic: is the user requesting a
+    conversion to the EASE coordinate system (or back), or are they working with
+    grid indices? The geodetic2ease conversion returns both the grid indices and
+    the coordinates in the EASE coordinate system. This is done because the
+    common use-case is to grid values into EASE grids, but the EASE coordinates
+    have to be calculated as part of this, and it is therefore unnecessary to
+    maintain separate functions. When converting back to geodetic, two functions
+    are instead provided:
 
     * ease_coord2geodetic
     * ease_index2geodetic
@@ -48,8 +247,18 @@ class EaseGrid(object):
     is set up with the same projection AND resolution). Description and further
     info: https://nsidc.org/ease/ease-grid-projection-gt
 
+    The geodetic centroids of the grid cells are available through the
+    geodetic_grid member, which is computed on first access (as float32) and
+    then kept, or in blocks of rows through geodetic_grid_chunks for grids too
+    large to hold in memory.
+
     Values are assumed to be in meters and degrees.
 
+    Instances are not modified after initialisation (the cached geodetic_grid
+    arrays are read-only), so they can safely be shared. Use get_ease_grid to
+    reuse a single instance per resolution and projection rather than
+    rebuilding the grid each time.
+
     Parameters
     ----------
     resolution_m : int
@@ -59,6 +268,15 @@ class EaseGrid(object):
 
     """
 
+    easeGL3m_xcols = _PROJ_TABLE["Global"].base_cols
+    easeGL3m_yrows = _PROJ_TABLE["Global"].base_rows
+
+    easeNH3m_xcols = _PROJ_TABLE["NorthHemi"].base_cols
+    easeNH3m_yrows = _PROJ_TABLE["NorthHemi"].base_rows
+
+    easeSH3m_xcols = _PROJ_TABLE["SouthHemi"].base_cols
+    easeSH3m_yrows = _PROJ_TABLE["SouthHemi"].base_rows
+
     def __init__(self, resolution_m: int, projection: str) -> None:
         """
         Parameters
@@ -68,65 +286,87 @@ class EaseGrid(object):
         projection : str
             projection to be used (NorthHemi, SouthHemi, or Global)
         """
+        # Both arguments are checked before any of the (comparatively slow)
+        # pyproj objects are created
+        try:
+            spec = _PROJ_TABLE[projection]
+        except KeyError:
+            msg = f"Unsupported projection {projection}! (must be NorthHemi/SouthHemi/Global)"
+            raise ValueError(msg) from None
+        # Numeric strings are accepted as well, as with the former int() cast
+        try:
+            resolution = float(resolution_m)
+        except (TypeError, ValueError):
+            resolution = math.nan
+        if not (resolution.is_integer() and resolution >= 3):
+            msg = (
+                f"Unsupported resolution {resolution_m!r}! "
+                "(must be a whole number of meters, at least 3)"
+            )
+            raise ValueError(msg)
+        res_scale = int(resolution / 3)
+        number_cols = int(spec.base_cols / res_scale)
+        number_rows = int(spec.base_rows / res_scale)
+        if not (number_cols and number_rows):
+            msg = (
+                f"Unsupported resolution {resolution_m!r}! "
+                f"(too coarse, the {projection} grid would have no cells)"
+            )
+            raise ValueError(msg)
+
         # Casting resolution to integer since needs to be a multiple of 3
-        self.resolution = int(resolution_m)
+        self.resolution = int(resolution)
         self.projection = projection
         # lat/lon projection
         #  Note that pyproj uses a lon, lat convention in argument order
         self.proj_latlon = pyproj.Proj("EPSG:4326")
 
-        self.easeGL3m_xcols = 11568000
-        self.easeGL3m_yrows = 4872000
-
-        self.easeNH3m_xcols = 6000000
-        self.easeNH3m_yrows = 6000000
-
-        self.easeSH3m_xcols = 6000000
-        self.easeSH3m_yrows = 6000000
-
-        res_scale = int(self.resolution / 3)
-
-        if self.projection == "NorthHemi":
-            self.description = "EASE Northern Hemisphere, Lambert Azimuthal projection"
-            self.proj_sgrid = pyproj.Proj("EPSG:6931")
-            # The validity range of the grid in terms of EASE coordinates
-            # Defined here in terms of the coordinates of one of the corners of
-            # the grid. These are symmetric so both ranges will be -|min/max| < 0 < |min/max|
-            self._xmin, self._ymax = (-9000000.0, 9000000.0)
-            self.number_cols = int(self.easeNH3m_xcols / res_scale)
-            self.number_rows = int(self.easeNH3m_yrows / res_scale)
-            self.grid_res_x = np.abs(self._xmin * 2) / self.number_cols
-            self.grid_res_y = np.abs(self._ymax * 2) / self.number_rows
-
-        elif self.projection == "SouthHemi":
-            self.description = "EASE Southern Hemisphere, Lambert Azimuthal projection"
-            self.proj_sgrid = pyproj.Proj("EPSG:6932")
-            # The validity range of the grid in terms of EASE coordinates
-            # Defined here in terms of the coordinates of one of the corners of
-            # the grid. These are symmetric so both ranges will be -|min/max| < 0 < |min/max|
-            self._xmin, self._ymax = (-9000000.0, 9000000.0)
-            self.number_cols = int(self.easeSH3m_xcols / res_scale)
-            self.number_rows = int(self.easeSH3m_yrows / res_scale)
-            self.grid_res_x = np.abs(self._xmin * 2) / self.number_cols
-            self.grid_res_y = np.abs(self._ymax * 2) / self.number_rows
-
-        elif self.projection == "Global":
-            self.description = "EASE Global, Equal-Area projection"
-            self.proj_sgrid = pyproj.Proj("EPSG:6933")
-            # The validity range of the grid in terms of EASE coordinates
-            # Defined here in terms of the coordinates of one of the corners of
-            # the grid. These are symmetric so both ranges will be -|min/max| < 0 < |min/max|
-            # The global grid latitude range depends slightly on resolution.
-            self._xmin = -17367530.45
-            self.number_cols = int(self.easeGL3m_xcols / res_scale)
-            self.number_rows = int(self.easeGL3m_yrows / res_scale)
-            self.grid_res_x = np.abs(self._xmin * 2) / self.number_cols
+        self.description = spec.description
+        self.epsg = spec.epsg
+        self.proj_sgrid = pyproj.Proj(f"EPSG:{spec.epsg}")
+        # The validity range of the grid in terms of EASE coordinates
+        # Defined here in terms of the coordinates of one of the corners of
+        # the grid. These are symmetric so both ranges will be -|min/max| < 0 < |min/max|
+        xmin = spec.xmin
+        self.number_cols = number_cols
+        self.number_rows = number_rows
+        self.grid_res_x = np.abs(xmin * 2) / self.number_cols
+        if spec.ymax is None:
+            # The global grid has square cells, so its latitude range depends
+            # slightly on resolution
             self.grid_res_y = self.grid_res_x
-            self._ymax = (self.number_rows * self.grid_res_y) / 2
-
+            ymax = (self.number_rows * self.grid_res_y) / 2
         else:
-            msg = f"Unsupported projection {self.projection}! (must be NorthHemi/SouthHemi/Global)"
-            raise ValueError(msg)
+            ymax = spec.ymax
+            self.grid_res_y = np.abs(ymax * 2) / self.number_rows
+
+        # Grid constants used by the conversions, gathered in one immutable
+        # tuple. The reciprocal resolutions mean that finding grid indices
+        # only needs multiplications.
+        self.params = _GridParams(
+            xmin=float(xmin),
+            xmax=float(-xmin),
+            ymax=float(ymax),
+            res_x=float(self.grid_res_x),
+            res_y=float(self.grid_res_y),
+            inv_res_x=float(1.0 / self.grid_res_x),
+            inv_res_y=float(1.0 / self.grid_res_y),
+            cols=self.number_cols,
+            rows=self.number_rows,
+            projection=self.projection,
+        )
+        # Cell edges along x and along -y (so that both ascend with the
+        # indices), which decide the cell of points on or next to an edge
+        self._x_edges = np.linspace(xmin, -xmin, self.number_cols + 1)
+        self._y_edges = np.linspace(-ymax, ymax, self.number_rows + 1)
+        # Integer type of the indices returned by geodetic2ease. int32 unless
+        # flat indices (row * number_cols + col) would overflow it, so that
+        # they can be computed without casting first
+        self._idx_dtype: typing.Type[np.signedinteger]
+        if self.number_cols * self.number_rows <= np.iinfo(np.int32).max:
+            self._idx_dtype = np.int32
+        else:
+            self._idx_dtype = np.int64
 
         logger.debug(f" {self.description}")
         logger.debug(f" Resolution: {self.resolution} m")
@@ -136,16 +376,252 @@ class EaseGrid(object):
         logger.debug(f" Res. in the y direction: {self.grid_res_y} m")
 
         # These are the actual coordinate converters
-        self.trans_lonlat2xy = pyproj.Transformer.from_proj(
-            self.proj_latlon, self.proj_sgrid, always_xy=True
-        )
+        #  Without numba, conversions call the projection (proj_sgrid) directly,
+        #  which is a little faster than these transformers as it skips the
+        #  axis order/unit steps of the lat/lon CRS (there is no datum shift
+        #  involved). The transformers are still used for in-place conversions,
+        #  which Proj does not support.
+        self.trans_lonlat2xy = _make_transformer(4326, self.epsg)
+        self.trans_xy2lonlat = _make_transformer(self.epsg, 4326)
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def get_ease_grid(cls, resolution_m: int, projection: str) -> "EaseGrid":
+        """
+        Return a shared grid instance for the given resolution and projection,
+        creating it on first use.
+
+        Parameters
+        ----------
+        resolution_m : int
+            resolution in meters
+        projection : str
+            projection to be used (NorthHemi, SouthHemi, or Global)
+        Returns
+        -------
+        grid : EaseGrid
+            grid instance, shared between all callers using the same arguments
+        """
+        return cls(resolution_m, projection)
+
+    @functools.cached_property
+    def geodetic_grid(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Geodetic centroids of all grid cells, as float32 arrays of shape
+        (number_rows, number_cols). Computed on first access and then kept, so
+        this should be avoided for the finest resolutions; see
+        geodetic_grid_chunks. The arrays are read-only, since they are shared
+        by all users of the grid.
+
+        Returns
+        -------
+        lat, lon : tuple[np.ndarray, np.ndarray]
+            read-only lat and lon values of the grid cell centroids
+        """
+        lat, lon = self.build_geodetic_grid(np.float32)
+        lat.setflags(write=False)
+        lon.setflags(write=False)
+        return lat, lon
+
+    def build_geodetic_grid(
+        self, dtype: npt.DTypeLike = np.float32, tile_size: int = _TILE_ELEMENTS
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the geodetic centroids of all grid cells. Unlike geodetic_grid,
+        the result is not kept by the grid.
+
+        Parameters
+        ----------
+        dtype : np.dtype
+            floating point type of the returned arrays
+        tile_size : int
+            number of elements of each float64 working buffer; the grid is
+            converted in blocks of max(1, tile_size // number_cols) rows
+        Returns
+        -------
+        lat, lon : tuple[np.ndarray, np.ndarray]
+            lat and lon values of the grid cell centroids, of shape
+            (number_rows, number_cols)
+        """
+        lat = np.empty((self.number_rows, self.number_cols), dtype=dtype)
+        lon = np.empty((self.number_rows, self.number_cols), dtype=dtype)
+        tile_rows = max(1, tile_size // self.number_cols)
+        for start, stop, lat_tile, lon_tile in self._iter_grid_tiles(tile_rows):
+            lat[start:stop] = lat_tile
+            lon[start:stop] = lon_tile
+        return lat, lon
+
+    def geodetic_grid_lazy(
+        self, dtype: npt.DTypeLike = np.float32
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Geodetic centroids of all grid cells, like geodetic_grid, but using as
+        little memory as possible. For the Global grid, latitude only depends
+        on the row and longitude only on the column, so the returned arrays are
+        broadcast (stride 0) views of a single column/row of values. The polar
+        grids are not separable in this way and are built in full with
+        build_geodetic_grid. The returned arrays are read-only in both cases.
 
-        self.trans_xy2lonlat = pyproj.Transformer.from_proj(
-            self.proj_sgrid, self.proj_latlon, always_xy=True
+        Parameters
+        ----------
+        dtype : np.dtype
+            floating point type of the returned arrays
+        Returns
+        -------
+        lat, lon : tuple[np.ndarray, np.ndarray]
+            read-only lat and lon values of the grid cell centroids, of shape
+            (number_rows, number_cols)
+        """
+        params = self.params
+        shape = (params.rows, params.cols)
+        if params.projection != "Global":
+            lat, lon = self.build_geodetic_grid(dtype)
+            lat.setflags(write=False)
+            lon.setflags(write=False)
+            return lat, lon
+
+        xx_row = (np.arange(params.cols) + 0.5) * params.res_x + params.xmin
+        yy_col = params.ymax - (np.arange(params.rows) + 0.5) * params.res_y
+        #  Note lon/lat convention used by pyproj is opposite to our own
+        lon_row, _ = self._fast_inverse(xx_row, np.zeros_like(xx_row))
+        _, lat_col = self._fast_inverse(np.zeros_like(yy_col), yy_col)
+        lat = np.broadcast_to(lat_col.astype(dtype)[:, np.newaxis], shape)
+        lon = np.broadcast_to(lon_row.astype(dtype)[np.newaxis, :], shape)
+        return lat, lon
+
+    def geodetic_grid_chunks(
+        self, tile: typing.Optional[int] = None, dtype: npt.DTypeLike = np.float32
+    ) -> typing.Iterator[typing.Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over the geodetic centroids of the grid cells in blocks of
+        rows, so that large grids can be processed without holding the full
+        grid in memory.
+
+        Parameters
+        ----------
+        tile : int, optional
+            maximum number of grid rows per block; by default, as many rows as
+            fit in 2**18 elements (at least one)
+        dtype : np.dtype
+            floating point type of the returned arrays
+        Yields
+        ------
+        lat, lon : tuple[np.ndarray, np.ndarray]
+            lat and lon values of the grid cell centroids for consecutive
+            blocks of rows, of shape (<= tile, number_cols)
+        """
+        if tile is None:
+            tile = max(1, _TILE_ELEMENTS // self.number_cols)
+        for _, _, lat, lon in self._iter_grid_tiles(tile):
+            yield lat.astype(dtype), lon.astype(dtype)
+
+    def _iter_grid_tiles(
+        self, tile_rows: int
+    ) -> typing.Iterator[typing.Tuple[int, int, np.ndarray, np.ndarray]]:
+        """
+        Convert the grid cell centroids to geodetic coordinates in blocks of
+        rows. Yields (start_row, stop_row, lat, lon), where lat and lon are
+        float64 buffers that are overwritten by the next block.
+        """
+        params = self.params
+        xx_row = (np.arange(params.cols) + 0.5) * params.res_x + params.xmin
+        yy_col = params.ymax - (np.arange(params.rows) + 0.5) * params.res_y
+        tile_rows = min(tile_rows, self.number_rows)
+        xx = np.empty((tile_rows, self.number_cols))
+        yy = np.empty((tile_rows, self.number_cols))
+        for start in range(0, self.number_rows, tile_rows):
+            stop = min(start + tile_rows, self.number_rows)
+            xx_tile = xx[: stop - start]
+            yy_tile = yy[: stop - start]
+            xx_tile[...] = xx_row
+            yy_tile[...] = yy_col[start:stop, np.newaxis]
+            # converts in place, so the x/y buffers now hold lon/lat
+            lon, lat = self._fast_inverse(xx_tile, yy_tile, inplace=True)
+            yield start, stop, lat, lon
+
+    def _fast_forward(self, lon: np.ndarray, lat: np.ndarray, inplace: bool = False):
+        """
+        Project lon/lat to EASE x/y, using the compiled closed-form kernels
+        when numba is available and the inputs are numeric arrays, and pyproj
+        (proj_sgrid, or trans_lonlat2xy for inplace) otherwise. With inplace,
+        lon and lat must be C-contiguous float64 arrays and are overwritten
+        with x and y.
+        """
+        if _kernels.supports(lon, lat):
+            return _kernels.forward(self.epsg, lon, lat, inplace=inplace)
+        if inplace:
+            return self.trans_lonlat2xy.transform(lon, lat, inplace=True)
+        return self.proj_sgrid(lon, lat)
+
+    def _xy2index(
+        self,
+        xx: np.ndarray,
+        yy: np.ndarray,
+        out_col: typing.Optional[np.ndarray] = None,
+        out_row: typing.Optional[np.ndarray] = None,
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the grid indices of EASE coordinates, writing them into out_col
+        and out_row if given. Raises a ValueError if any of the coordinates
+        are outside of the grid.
+        """
+        params = self.params
+        xx = np.asarray(xx)
+        yy = np.asarray(yy)
+        # check max and min values to make sure the points are within the grid
+        #  The grid is symmetric around 0 in both coordinates, and the
+        #  negated comparisons also reject nan values
+        outside_x = ~(np.abs(xx) <= params.xmax)
+        outside_y = ~(np.abs(yy) <= params.ymax)
+        if np.any(outside_x) or np.any(outside_y):
+            raise ValueError(_OUTSIDE_GRID_MSG)
+
+        # find EASE grid indexes of the point
+        if out_col is None or out_row is None:
+            out_col = np.empty(xx.shape, dtype=self._idx_dtype)
+            out_row = np.empty(yy.shape, dtype=self._idx_dtype)
+        _cell_index(xx, self._x_edges, params.inv_res_x, 1, out_col)
+        _cell_index(yy, self._y_edges, params.inv_res_y, -1, out_row)
+        return out_col, out_row
+
+    def _geodetic2ease_point(
+        self, lat: float, lon: float
+    ) -> typing.Tuple[typing.Tuple[int, int], typing.Tuple[float, float]]:
+        """
+        geodetic2ease for a single point, in plain Python to avoid the numpy
+        overhead.
+        """
+        params = self.params
+        if abs(lat) > 90.0:
+            raise ValueError(_LAT_RANGE_MSG)
+        xx, yy = self.trans_lonlat2xy.transform(lon, lat)
+        if not (abs(xx) <= params.xmax and abs(yy) <= params.ymax):
+            raise ValueError(_OUTSIDE_GRID_MSG)
+        xcol_id = _cell_index_scalar(
+            xx, params.xmin, params.inv_res_x, 1, self._x_edges
         )
+        yrow_id = _cell_index_scalar(
+            yy, params.ymax, params.inv_res_y, -1, self._y_edges
+        )
+        return (xcol_id, yrow_id), (xx, yy)
 
-        x_grid, y_grid = np.meshgrid(range(self.number_cols), range(self.number_rows))
-        self.geodetic_grid = self.ease_index2geodetic(x_grid, y_grid)
+    def _fast_inverse(self, xx: np.ndarray, yy: np.ndarray, inplace: bool = False):
+        """
+        Convert EASE x/y back to lon/lat, using the compiled closed-form
+        kernels when numba is available and the inputs are numeric arrays,
+        and pyproj (proj_sgrid, or trans_xy2lonlat for inplace) otherwise.
+        With inplace, xx and yy must be C-contiguous float64 arrays and are
+        overwritten with lon and lat.
+        """
+        if _kernels.supports(xx, yy):
+            return _kernels.inverse(self.epsg, xx, yy, inplace=inplace)
+        if inplace:
+            return self.trans_xy2lonlat.transform(xx, yy, inplace=True)
+        if np.shape(xx) != np.shape(yy):
+            # pyproj does not broadcast, so expand e.g. a row of column
+            # indices against a column of row indices here
+            xx, yy = (np.ascontiguousarray(v) for v in np.broadcast_arrays(xx, yy))
+        return self.proj_sgrid(xx, yy, inverse=True)
 
     def geodetic2ease(
         self, lat: np.ndarray, lon: np.ndarray
@@ -166,32 +642,158 @@ class EaseGrid(object):
         -------
         ease_coords : tuple[xcol_id, yrow_id], tuple[xx, yy]
             EASE grid indices of the point(s), and corresponding EASE projection
-            coordinates. Take same shape as input values.
+            coordinates. Take same shape as input values. The indices are int32
+            if flat indices (row * number_cols + col) fit into it (e.g. for all
+            resolutions of 1 km and coarser), and int64 otherwise. Scalar inputs
+            give Python int and float values.
         """
+        if np.isscalar(lat) and np.isscalar(lon):
+            # Scalars give Python numbers (see Returns), hence the ignore
+            return self._geodetic2ease_point(lat, lon)  # type: ignore
 
-        if (np.abs(np.array([lat])) > 90.0).any():
-            msg = "There are input lat values with absolute values above 90 degrees."
-            raise ValueError(msg)
+        if np.any(np.abs(lat) > 90.0):
+            raise ValueError(_LAT_RANGE_MSG)
 
         # find EASE projection x and y coordinates of the point at lon, lat
         #  Note lon/lat convention used by pyproj is opposite to our own
-        xx, yy = self.trans_lonlat2xy.transform(lon, lat)
+        xx, yy = self._fast_forward(lon, lat)
 
-        # check max and min values to make sure the points are within the grid
-        if np.array([(xx < self._xmin)]).any() or np.array([(xx > -self._xmin)]).any():
-            msg = "Some geodetic coordinates are outside of EASE grid validity range. \
-                   Check documentation at https://nsidc.org/ease/ease-grid-projection-gt."
-            raise ValueError(msg)
-        if np.array([(yy > self._ymax)]).any() or np.array([(yy < -self._ymax)]).any():
-            msg = "Some geodetic coordinates are outside of EASE grid validity range. \
-                   Check documentation at https://nsidc.org/ease/ease-grid-projection-gt."
+        return self._xy2index(xx, yy), (xx, yy)
+
+    def geodetic2ease_many(
+        self, lat: np.ndarray, lon: np.ndarray
+    ) -> typing.Tuple[
+        typing.Tuple[np.ndarray, np.ndarray], typing.Tuple[np.ndarray, np.ndarray]
+    ]:
+        """
+        Batch version of geodetic2ease for (large) arrays of points. Inputs
+        that are already C-contiguous float64 arrays are used as they are,
+        others are converted once, and the EASE coordinates are written to new
+        arrays, so the inputs are left unchanged.
+
+        Parameters
+        ----------
+        lat : np.ndarray
+            latitudes of the points (in degrees)
+        lon : np.ndarray
+            longitudes of the points (in degrees), same shape as lat
+        Returns
+        -------
+        ease_coords : tuple[xcol_id, yrow_id], tuple[xx, yy]
+            EASE grid indices of the points, and corresponding EASE projection
+            coordinates, as for geodetic2ease. Take same shape as input values.
+        """
+        lat = np.asarray(lat)
+        lon = np.asarray(lon)
+        if lat.shape != lon.shape:
+            msg = "lat and lon must have the same shape."
             raise ValueError(msg)
+        if np.any(np.abs(lat) > 90.0):
+            raise ValueError(_LAT_RANGE_MSG)
 
-        # find EASE grid indexes of the point
-        xcol_id = ((xx - self._xmin) / self.grid_res_x).astype(int)
-        yrow_id = ((self._ymax - yy) / self.grid_res_y).astype(int)
+        shape = lat.shape
+        # no copies for inputs that are already C-contiguous float64 (at least 1D)
+        #  Note lon/lat convention used by pyproj is opposite to our own
+        lon = np.ascontiguousarray(lon, dtype=np.float64)
+        lat = np.ascontiguousarray(lat, dtype=np.float64)
+        xx, yy = self._fast_forward(lon, lat)
+        xx = np.reshape(xx, shape)
+        yy = np.reshape(yy, shape)
+
+        return self._xy2index(xx, yy), (xx, yy)
+
+    def geodetic2ease_into(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        out_xx: np.ndarray,
+        out_yy: np.ndarray,
+        out_col: np.ndarray,
+        out_row: np.ndarray,
+    ) -> typing.Tuple[
+        typing.Tuple[np.ndarray, np.ndarray], typing.Tuple[np.ndarray, np.ndarray]
+    ]:
+        """
+        Version of geodetic2ease writing its results into caller provided
+        arrays, so that repeated calls (e.g. over chunks of equal size) do not
+        allocate new output arrays each time. Finding the grid indices still
+        allocates some temporary arrays.
 
-        return (xcol_id, yrow_id), (xx, yy)
+        Parameters
+        ----------
+        lat : np.ndarray
+            latitude(s) of the point(s) (in degrees)
+        lon : np.ndarray
+            longitude(s) of the point(s) (in degrees)
+        out_xx : np.ndarray
+            C-contiguous (at least 1D) float64 array receiving the EASE x
+            coordinates
+        out_yy : np.ndarray
+            C-contiguous (at least 1D) float64 array receiving the EASE y
+            coordinates
+        out_col : np.ndarray
+            signed integer array receiving the column indices, of the same
+            shape as out_xx and at least as wide as the indices returned by
+            geodetic2ease
+        out_row : np.ndarray
+            signed integer array receiving the row indices, like out_col
+        Returns
+        -------
+        ease_coords : tuple[out_col, out_row], tuple[out_xx, out_yy]
+            The output arrays, all of the same shape as lat and lon.
+        """
+        for out in (out_xx, out_yy):
+            if out.dtype != np.float64 or not out.flags.c_contiguous or not out.ndim:
+                msg = "out_xx and out_yy must be C-contiguous float64 arrays."
+                raise ValueError(msg)
+        for out in (out_yy, out_col, out_row):
+            if out.shape != out_xx.shape:
+                msg = "All output arrays must have the same shape."
+                raise ValueError(msg)
+        for out in (out_col, out_row):
+            if out.dtype.kind != "i" or not np.can_cast(self._idx_dtype, out.dtype):
+                msg = (
+                    "out_col and out_row must be signed integer arrays able to "
+                    f"hold {np.dtype(self._idx_dtype).name} indices."
+                )
+                raise ValueError(msg)
+        if np.any(np.abs(lat) > 90.0):
+            raise ValueError(_LAT_RANGE_MSG)
+
+        # projected in place, so out_xx/out_yy go from lon/lat to x/y
+        #  Note lon/lat convention used by pyproj is opposite to our own
+        out_xx[...] = lon
+        out_yy[...] = lat
+        self._fast_forward(out_xx, out_yy, inplace=True)
+
+        return self._xy2index(out_xx, out_yy, out_col, out_row), (out_xx, out_yy)
+
+    def geodetic2ease_gpu(self, lat, lon):
+        """
+        GPU version of geodetic2ease for large inputs, using the closed-form
+        EASE projections as a CUDA kernel (one thread per point). Requires
+        cupy and numba with CUDA support.
+
+        Parameters
+        ----------
+        lat : cupy.ndarray
+            latitude(s) of the point(s) (in degrees)
+        lon : cupy.ndarray
+            longitude(s) of the point(s) (in degrees), same shape as lat
+        Returns
+        -------
+        ease_coords : tuple[xcol_id, yrow_id], tuple[xx, yy]
+            EASE grid indices of the point(s), and corresponding EASE projection
+            coordinates, as cupy arrays on the device. Take same shape as input
+            values, and the indices have the same integer type as for
+            geodetic2ease. The indices are found in the same way as there, so
+            they match the ones from geodetic2ease, including for points on or
+            next to cell edges.
+        """
+        # Imported here so that cupy/numba.cuda are only loaded when used
+        from . import _cuda
+
+        return _cuda.geodetic2ease(self, lat, lon)
 
     def ease_coord2geodetic(
         self, xx: np.ndarray, yy: np.ndarray
@@ -213,7 +815,10 @@ class EaseGrid(object):
         """
 
         #  Note lon/lat convention used by pyproj is opposite to our own
-        lon, lat = self.trans_xy2lonlat.transform(xx, yy)
+        if np.isscalar(xx) and np.isscalar(yy):
+            lon, lat = self.trans_xy2lonlat.transform(xx, yy)
+        else:
+            lon, lat = self._fast_inverse(xx, yy)
         return lat, lon
 
     def ease_index2geodetic(
@@ -235,10 +840,13 @@ class EaseGrid(object):
         lat, lon : tuple[np.ndarray, np.ndarray]
             lat and lon values in geodetic coordinate system
         """
-
-        xx = (xcol_id + 0.5) * self.grid_res_x + self._xmin
-        yy = -(yrow_id + 0.5) * self.grid_res_y + self._ymax
+        params = self.params
+        xx = (xcol_id + 0.5) * params.res_x + params.xmin
+        yy = -(yrow_id + 0.5) * params.res_y + params.ymax
 
         #  Note lon/lat convention used by pyproj is opposite to our own
-        lon, lat = self.trans_xy2lonlat.transform(xx, yy)
+        if np.isscalar(xx) and np.isscalar(yy):
+            lon, lat = self.trans_xy2lonlat.transform(xx, yy)
+        else:
+            lon, lat = self._fast_inverse(xx, yy)
         return lat, lon
@@ -1,13 +1,14 @@
 import os
+import sys
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import numpy as np
 import pytest
 import s3fs
 import zarr
 
-from easepy import EaseGrid
+from easepy import EaseGrid, _cuda, _kernels
 
 path = Path(__file__)
 BASE_FILE_LOCATION = "s3://public-test-data/easepy/"
@@ -35,6 +36,64 @@ class TestEasepy(TestCase):
         )
         self.assertTrue((x_ind == np.array([737, 755, 750])).all())
         self.assertTrue((y_ind == np.array([611, 796, 749])).all())
+        self.assertEqual(x_ind.dtype, np.int32)
+        self.assertEqual(y_ind.dtype, np.int32)
+
+    @pytest.mark.unit
+    def test_ease_north_hemi_flat_index(self):
+        ease = EaseGrid(36000, "NorthHemi")
+        (x_ind, y_ind), _ = ease.geodetic2ease(np.array([60.0]), np.array([100.0]))
+        self.assertEqual((x_ind[0], y_ind[0]), (340, 234))
+        flat = y_ind * ease.number_cols + x_ind
+        self.assertEqual(flat[0], 117340)
+        self.assertEqual(EaseGrid(100, "Global")._idx_dtype, np.int64)
+
+    @pytest.mark.unit
+    def test_ease_north_hemi_geodetic2ease_many(self):
+        ease = EaseGrid(12000, "NorthHemi")
+        lats = np.array([[75, 85], [89.99, 60]])
+        lons = np.array([[-175, 7], [155, 20]])
+        (x_ind, y_ind), (x, y) = ease.geodetic2ease_many(lats, lons)
+        (x_ind2, y_ind2), (x2, y2) = ease.geodetic2ease(lats, lons)
+        self.assertEqual(x.shape, (2, 2))
+        self.assertTrue((x_ind == x_ind2).all())
+        self.assertTrue((y_ind == y_ind2).all())
+        self.assertTrue(np.allclose(x, x2))
+        self.assertTrue(np.allclose(y, y2))
+        self.assertEqual(lats[0, 0], 75)
+        with pytest.raises(ValueError):
+            ease.geodetic2ease_many(np.array([-80.0, 85.0]), np.array([-175.0, 7.0]))
+
+    @pytest.mark.unit
+    def test_ease_north_hemi_geodetic2ease_into(self):
+        ease = EaseGrid(12000, "NorthHemi")
+        lats = np.array([75, 85, 89.99])
+        lons = np.array([-175, 7, 155])
+        out_xx = np.empty(3)
+        out_yy = np.empty(3)
+        out_col = np.empty(3, dtype=np.int32)
+        out_row = np.empty(3, dtype=np.int32)
+        (x_ind, y_ind), (x, y) = ease.geodetic2ease_into(
+            lats, lons, out_xx, out_yy, out_col, out_row
+        )
+        self.assertIs(x_ind, out_col)
+        self.assertIs(x, out_xx)
+        self.assertTrue((x_ind == np.array([737, 755, 750])).all())
+        self.assertTrue((y_ind == np.array([611, 796, 749])).all())
+        (x_ind2, y_ind2), (x2, y2) = ease.geodetic2ease(lats, lons)
+        self.assertTrue(np.allclose(x, x2))
+        self.assertTrue(np.allclose(y, y2))
+        with pytest.raises(ValueError):
+            ease.geodetic2ease_into(
+                lats, lons, out_xx.astype(np.float32), out_yy, out_col, out_row
+            )
+        for bad_col in (
+            out_col.astype(np.int8),
+            out_col.astype(np.float64),
+            np.empty(4, dtype=np.int32),
+        ):
+            with pytest.raises(ValueError):
+                ease.geodetic2ease_into(lats, lons, out_xx, out_yy, bad_col, out_row)
 
     @pytest.mark.unit
     def test_ease_north_hemi_geodetic2ease_array_outside_grid(self):
@@ -87,6 +146,19 @@ class TestEasepy(TestCase):
             EaseGrid(12000, "SH")
         self.assertEqual(e_info.type, ValueError)
 
+    @pytest.mark.unit
+    def test_ease_raises_resolution_value_error(self):
+        for resolution in (0, -9000, 2, 9000.5, "9 km", None, 10 ** 9):
+            with pytest.raises(Exception) as e_info:
+                EaseGrid(resolution, "NorthHemi")
+            self.assertEqual(e_info.type, ValueError)
+
+    @pytest.mark.unit
+    def test_ease_numeric_string_resolution(self):
+        ease = EaseGrid("25000", "Global")
+        self.assertEqual(ease.resolution, 25000)
+        self.assertEqual(ease.number_cols, EaseGrid(25000, "Global").number_cols)
+
     @pytest.mark.unit
     def test_ease_raises_latitude_value_error(self):
         with pytest.raises(Exception) as e_info:
@@ -175,6 +247,214 @@ class TestEasepy(TestCase):
         self.assertEqual(264, x_ind)
         self.assertEqual(723, y_ind)
 
+    @pytest.mark.unit
+    def test_ease_get_ease_grid_shared_instance(self):
+        ease = EaseGrid.get_ease_grid(36000, "Global")
+        self.assertIs(ease, EaseGrid.get_ease_grid(36000, "Global"))
+        self.assertIsNot(ease, EaseGrid.get_ease_grid(36000, "NorthHemi"))
+        self.assertIs(ease.trans_lonlat2xy, EaseGrid(36000, "Global").trans_lonlat2xy)
+
+    @pytest.mark.unit
+    def test_ease_kernels_agree_with_pyproj(self):
+        lats = np.array([75, 85, 89.99, 0.0, -45.0, -80.0])
+        lons = np.array([-175, 7, 155, 180.0, 200.0, -33.0])
+        for projection in ["NorthHemi", "SouthHemi", "Global"]:
+            ease = EaseGrid(36000, projection)
+            sign = -1 if projection == "SouthHemi" else 1
+            x, y = ease.trans_lonlat2xy.transform(lons, sign * lats)
+            x_k, y_k = _kernels.forward(ease.epsg, lons, sign * lats)
+            self.assertTrue(np.allclose(x, x_k, rtol=0, atol=1e-3))
+            self.assertTrue(np.allclose(y, y_k, rtol=0, atol=1e-3))
+            lon, lat = ease.trans_xy2lonlat.transform(x, y)
+            lon_k, lat_k = _kernels.inverse(ease.epsg, x, y)
+            self.assertTrue(np.allclose(lon, lon_k, rtol=0, atol=1e-9))
+            self.assertTrue(np.allclose(lat, lat_k, rtol=0, atol=1e-9))
+
+    @pytest.mark.unit
+    def test_ease_kernel_indices_match_pyproj(self):
+        rng = np.random.default_rng(0)
+        for projection in ["NorthHemi", "SouthHemi", "Global"]:
+            ease = EaseGrid(9000, projection)
+            params = ease.params
+            # random points all over the grid, as lat/lon
+            xx = rng.uniform(params.xmin, params.xmax, 50000)
+            yy = rng.uniform(-params.ymax, params.ymax, 50000)
+            lon, lat = ease.proj_sgrid(xx, yy, inverse=True)
+            valid = np.isfinite(lat) & np.isfinite(lon)
+            lon, lat = lon[valid], lat[valid]
+            x_k, y_k = _kernels.forward(ease.epsg, lon, lat)
+            x_p, y_p = ease.proj_sgrid(lon, lat)
+            inside = (np.abs(x_p) <= params.xmax) & (np.abs(y_p) <= params.ymax)
+            self.assertGreater(inside.sum(), 30000)
+            col_k, row_k = ease._xy2index(x_k[inside], y_k[inside])
+            col_p, row_p = ease._xy2index(x_p[inside], y_p[inside])
+            self.assertTrue(np.array_equal(col_k, col_p))
+            self.assertTrue(np.array_equal(row_k, row_p))
+
+    @pytest.mark.unit
+    def test_ease_broken_numba_falls_back_to_pyproj(self):
+        # numba raises ImportError on import e.g. for unsupported numpy versions
+        _kernels._loops.cache_clear()
+        try:
+            with mock.patch.object(_kernels, "HAS_NUMBA", True), mock.patch.dict(
+                sys.modules, {"numba": None}
+            ):
+                ease = EaseGrid(12000, "NorthHemi")
+                lats = np.array([75, 85, 89.99])
+                lons = np.array([-175, 7, 155])
+                (x_ind, y_ind), _ = ease.geodetic2ease(lats, lons)
+                self.assertTrue((x_ind == np.array([737, 755, 750])).all())
+                self.assertTrue((y_ind == np.array([611, 796, 749])).all())
+                self.assertFalse(_kernels.HAS_NUMBA)
+                self.assertFalse(_kernels.supports(lats, lons))
+                lat, lon = ease.ease_index2geodetic(np.array([500]), np.array([400]))
+                self.assertTrue(np.isclose(lat, 42.419164).all())
+        finally:
+            _kernels._loops.cache_clear()
+
+    @pytest.mark.unit
+    def test_ease_geodetic_grid_chunks(self):
+        ease = EaseGrid(36000, "NorthHemi")
+        grid_lats, grid_lons = ease.geodetic_grid
+        self.assertEqual(grid_lats.dtype, np.float32)
+        self.assertFalse(grid_lats.flags.writeable)
+        self.assertFalse(grid_lons.flags.writeable)
+        self.assertEqual(grid_lats.shape, (ease.number_rows, ease.number_cols))
+        chunks = list(ease.geodetic_grid_chunks(tile=100, dtype=np.float64))
+        self.assertEqual(len(chunks), 5)
+        chunk_lats = np.concatenate([lat for lat, _ in chunks])
+        chunk_lons = np.concatenate([lon for _, lon in chunks])
+        self.assertTrue(np.allclose(grid_lats, chunk_lats, equal_nan=True))
+        self.assertTrue(np.allclose(grid_lons, chunk_lons, equal_nan=True))
+        lat, lon = ease.ease_index2geodetic(300, 200)
+        self.assertTrue(np.isclose(chunk_lats[200, 300], lat))
+        self.assertTrue(np.isclose(chunk_lons[200, 300], lon))
+        # a budget smaller than a row still converts one row at a time
+        tiled_lats, tiled_lons = ease.build_geodetic_grid(np.float32, tile_size=1)
+        np.testing.assert_array_equal(tiled_lats, grid_lats)
+        np.testing.assert_array_equal(tiled_lons, grid_lons)
+        chunks = list(ease.geodetic_grid_chunks())
+        self.assertTrue(
+            all(lat.shape[0] * ease.number_cols <= 1 << 18 for lat, _ in chunks)
+        )
+        self.assertEqual(sum(lat.shape[0] for lat, _ in chunks), ease.number_rows)
+
+    @pytest.mark.unit
+    def test_ease_cell_edges(self):
+        ease = EaseGrid(36000, "NorthHemi")
+        # points on every cell edge, and just below them
+        xx = np.concatenate([ease._x_edges, np.nextafter(ease._x_edges[1:], -np.inf)])
+        yy = np.zeros_like(xx)
+        expected = np.append(np.arange(ease.number_cols), ease.number_cols - 1)
+        expected = np.concatenate([expected, np.arange(ease.number_cols)])
+        # large batch, small batches and single points
+        xcol_id, _ = ease._xy2index(xx, yy)
+        self.assertTrue(np.array_equal(xcol_id, expected))
+        xcol_id, _ = ease._xy2index(xx[:10], yy[:10])
+        self.assertTrue(np.array_equal(xcol_id, expected[:10]))
+        (xcol_id, yrow_id), _ = ease.geodetic2ease(90.0, 0.0)
+        self.assertEqual((xcol_id, yrow_id), (250, 250))
+        # the per-point version used by the CUDA kernel
+        for i, x in enumerate(xx):
+            self.assertEqual(
+                _cuda._cell_index_point(x, ease._x_edges, ease.params.inv_res_x),
+                expected[i],
+            )
+
+    @pytest.mark.unit
+    def test_ease_nan_coordinates(self):
+        ease = EaseGrid(36000, "NorthHemi")
+        # small batches, large batches and single points
+        for size in (3, 1000):
+            xx = np.zeros(size)
+            xx[1] = np.nan
+            with pytest.raises(ValueError):
+                ease._xy2index(xx, np.zeros(size))
+            with pytest.raises(ValueError):
+                ease._xy2index(np.zeros(size), xx)
+            with pytest.raises(ValueError):
+                ease.geodetic2ease(xx + 45.0, np.zeros(size))
+        with pytest.raises(ValueError):
+            ease.geodetic2ease(float("nan"), 0.0)
+
+    def _gpu_test_points(self, ease):
+        # geodetic coordinates of all cell edges along both axes (including
+        # the outer ones) and of random points within the grid
+        params = ease.params
+        rng = np.random.default_rng(0)
+        xx = np.concatenate(
+            [ease._x_edges, np.zeros(params.rows + 1), rng.uniform(-1, 1, 5000)]
+        )
+        yy = np.concatenate(
+            [np.zeros(params.cols + 1), -ease._y_edges, rng.uniform(-1, 1, 5000)]
+        )
+        xx[-5000:] *= params.xmax
+        yy[-5000:] *= params.ymax
+        lon, lat = ease.proj_sgrid(xx, yy, inverse=True)
+        valid = np.isfinite(lat) & np.isfinite(lon)
+        return lat[valid], lon[valid]
+
+    @pytest.mark.unit
+    def test_ease_cuda_kernel_matches_cpu(self):
+        if not _cuda.HAS_NUMBA_CUDA:
+            pytest.skip("numba.cuda is not available")
+        if os.environ.get("NUMBA_ENABLE_CUDASIM") != "1":
+            if not _cuda.cuda.is_available():
+                pytest.skip("needs a GPU, or NUMBA_ENABLE_CUDASIM=1")
+        for projection in ["NorthHemi", "SouthHemi", "Global"]:
+            ease = EaseGrid(36000, projection)
+            lat, lon = self._gpu_test_points(ease)
+            xx, yy = np.empty_like(lat), np.empty_like(lat)
+            col = np.empty(lat.shape, dtype=ease._idx_dtype)
+            row = np.empty(lat.shape, dtype=ease._idx_dtype)
+            _cuda._launch(
+                ease, lat, lon, ease._x_edges, ease._y_edges, xx, yy, col, row
+            )
+            # same indices as the CPU for the same EASE coordinates, and -1
+            # exactly for the points outside of the grid
+            inside = (np.abs(xx) <= ease.params.xmax) & (np.abs(yy) <= ease.params.ymax)
+            self.assertTrue((col[~inside] == -1).all())
+            col_cpu, row_cpu = ease._xy2index(xx[inside], yy[inside])
+            self.assertTrue(np.array_equal(col[inside], col_cpu))
+            self.assertTrue(np.array_equal(row[inside], row_cpu))
+            self.assertIn(ease.number_cols - 1, col)
+
+    @pytest.mark.unit
+    def test_ease_geodetic2ease_gpu(self):
+        cupy = pytest.importorskip("cupy")
+        if not _cuda.HAS_CUDA or not _cuda.cuda.is_available():
+            pytest.skip("needs a GPU")
+        for projection in ["NorthHemi", "SouthHemi", "Global"]:
+            ease = EaseGrid(36000, projection)
+            lat, lon = self._gpu_test_points(ease)
+            # only the points inside the grid, which geodetic2ease accepts
+            xx, yy = _kernels.forward(ease.epsg, lon, lat)
+            inside = (np.abs(xx) <= ease.params.xmax) & (np.abs(yy) <= ease.params.ymax)
+            lat, lon = lat[inside], lon[inside]
+            (col, row), (xx, yy) = ease.geodetic2ease_gpu(
+                cupy.asarray(lat), cupy.asarray(lon)
+            )
+            xx, yy = cupy.asnumpy(xx), cupy.asnumpy(yy)
+            _, (xx_cpu, yy_cpu) = ease.geodetic2ease(lat, lon)
+            self.assertTrue(np.allclose(xx, xx_cpu, rtol=0, atol=1e-3))
+            self.assertTrue(np.allclose(yy, yy_cpu, rtol=0, atol=1e-3))
+            # the GPU and CPU cells agree exactly for the same coordinates,
+            # also for points on the outer edges
+            col_cpu, row_cpu = ease._xy2index(xx, yy)
+            self.assertTrue(np.array_equal(cupy.asnumpy(col), col_cpu))
+            self.assertTrue(np.array_equal(cupy.asnumpy(row), row_cpu))
+
+    @pytest.mark.unit
+    def test_ease_geodetic_grid_lazy(self):
+        for projection in ["Global", "SouthHemi"]:
+            ease = EaseGrid(36000, projection)
+            grid_lats, grid_lons = ease.geodetic_grid
+            lazy_lats, lazy_lons = ease.geodetic_grid_lazy()
+            self.assertEqual(lazy_lats.shape, grid_lats.shape)
+            self.assertFalse(lazy_lats.flags.writeable)
+            self.assertTrue(np.allclose(grid_lats, lazy_lats, equal_nan=True))
+            self.assertTrue(np.allclose(grid_lons, lazy_lons, equal_nan=True))
+
     @pytest.mark.unit
     def test_ease_grid_agreement_36km(self):
         fs = s3fs.S3FileSystem(anon=False)